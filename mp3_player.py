@@ -3,15 +3,21 @@
 A clean, modern MP3 player with recursive directory browsing.
 
 Requirements:
-    pip install pygame mutagen
+    pip install pygame
 """
 
+import io
 import os
 import sys
+import json
+import random
 import time
 import threading
+import bisect
+from collections import deque
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk, filedialog, messagebox, font as tkfont
 from pathlib import Path
 
 try:
@@ -21,12 +27,15 @@ except ImportError:
     print("Please install pygame: pip install pygame")
     sys.exit(1)
 
+# End-of-track notifications arrive through SDL's event queue, which needs the
+# video subsystem; where that can't start we fall back to polling get_busy().
+TRACK_END = pygame.USEREVENT + 1
 try:
-    from mutagen.mp3 import MP3
-    from mutagen.id3 import ID3, TIT2, TPE1, TALB
-    HAS_MUTAGEN = True
-except ImportError:
-    HAS_MUTAGEN = False
+    pygame.display.init()
+    pygame.mixer.music.set_endevent(TRACK_END)
+    HAS_ENDEVENT = True
+except pygame.error:
+    HAS_ENDEVENT = False
 
 # ── Color Palette ──────────────────────────────────────────────────────────────
 BG         = "#0f0f13"
@@ -49,6 +58,20 @@ FONT_SMALL  = ("Helvetica", 9)
 FONT_LIST   = ("Helvetica", 11)
 FONT_MONO   = ("Courier", 9)
 
+SEARCH_DEBOUNCE_MS = 120     # coalesce keystrokes into one listbox refresh
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # tag reads are I/O-bound
+MP3_SUFFIXES = (".mp3", ".MP3", ".Mp3", ".mP3")  # every case of ".mp3"
+POLL_MS      = 250           # playback poll interval while a track is playing
+POLL_TAIL_MS = 50            # ...and within the last 2 s, to catch the end promptly
+AUTOSCAN_MS  = 50            # row step interval while drag-selecting past an edge
+META_BATCH   = 50            # tag updates applied to the listbox per UI callback
+CACHE_PATH   = Path.home() / ".pybeats_cache.json"
+
+# Playlist column attribute -> key of the per-track dicts built while scanning
+TRACK_COLUMNS = (("paths", "path"), ("titles", "title"), ("artists", "artist"),
+                 ("albums", "album"), ("durations", "duration"),
+                 ("labels", "_label"), ("labels_lower", "_label_lower"))
+
 
 def format_time(seconds):
     if seconds is None or seconds < 0:
@@ -57,29 +80,300 @@ def format_time(seconds):
     return f"{m}:{s:02d}"
 
 
+def gradient_colors(top, bottom, steps=180):
+    """Hex colours stepping from RGB `top` towards `bottom`, one per row."""
+    colors = []
+    for y in range(steps):
+        ratio = y / steps
+        r, g, b = (int(a + (z - a) * ratio) for a, z in zip(top, bottom))
+        colors.append(f"#{r:02x}{g:02x}{b:02x}")
+    return colors
+
+
+# Album art backgrounds are pure functions of the row, so build them at import
+IDLE_GRADIENT = gradient_colors((0x22, 0x22, 0x2c), (0x0f, 0x0f, 0x13))
+PLAY_GRADIENT = gradient_colors((0x3b, 0x0f, 0x52), (0x18, 0x0f, 0x1f))
+
+
+def make_gradient(master, colors, width=220):
+    """PhotoImage with one row per colour, filled by a single put()."""
+    img = tk.PhotoImage(master=master, width=width, height=len(colors))
+    img.put(" ".join("{" + " ".join([c] * width) + "}" for c in colors))
+    return img
+
+
+# ── MP3 Parsing ───────────────────────────────────────────────────────────────
+# Just enough of ID3v2 and the MPEG audio frame header to fill in title,
+# artist, album and duration from one short sequential read.
+
+ID3_FIELDS = {"TIT2": "title", "TPE1": "artist", "TALB": "album",
+              "TT2": "title", "TP1": "artist", "TAL": "album"}   # v2.3/4, v2.2
+
+# Layer III tables, indexed by MPEG version bits (3 = MPEG-1, 2 = 2, 0 = 2.5)
+_BITRATES = {3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+             2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)}
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000),
+                 0: (11025, 12000, 8000)}
+
+
+def _syncsafe(b):
+    return (b[0] & 0x7f) << 21 | (b[1] & 0x7f) << 14 | (b[2] & 0x7f) << 7 | (b[3] & 0x7f)
+
+
+def _decode_text(payload):
+    enc = payload[0]
+    codec = ("latin-1", "utf-16", "utf-16-be", "utf-8")[enc] if enc < 4 else "latin-1"
+    values = payload[1:].decode(codec, "replace").split("\0")
+    values = [v.strip("\ufeff").strip() for v in values]  # BOM per utf-16 value
+    return "/".join(v for v in values if v)
+
+
+def _read_id3v2(fh, header):
+    """Text fields from the ID3v2 tag whose 10-byte `header` was just read.
+
+    Frame headers are read one at a time and frames we don't want (cover
+    art and the like) are seeked over, stopping once every field is found.
+    Leaves `fh` at an unspecified position.
+    """
+    major, flags = header[3], header[5]
+    size = _syncsafe(header[6:10])
+    if major < 4 and flags & 0x80:
+        # v2.2/2.3 tag-wide unsynchronisation: frame sizes count decoded
+        # bytes, so this (rare) case still needs the whole tag in memory.
+        fh = io.BytesIO(fh.read(size).replace(b"\xff\x00", b"\xff"))
+        size = len(fh.getvalue())
+    start = fh.tell()
+    pos = 0
+    if major >= 3 and flags & 0x40:        # extended header
+        ext = fh.read(4)
+        pos = _syncsafe(ext) if major == 4 else 4 + int.from_bytes(ext, "big")
+    id_len, hdr_len = (3, 6) if major == 2 else (4, 10)
+    wanted = len(set(ID3_FIELDS.values()))
+
+    found = {}
+    while pos + hdr_len <= size and len(found) < wanted:
+        fh.seek(start + pos)
+        hdr = fh.read(hdr_len)
+        if len(hdr) < hdr_len or hdr[0] == 0:
+            break                          # truncated, or padding reached
+        fid = hdr[:id_len].decode("latin-1")
+        raw = hdr[id_len:hdr_len - (2 if major > 2 else 0)]
+        frame_size = _syncsafe(raw) if major == 4 else int.from_bytes(raw, "big")
+        fflags = hdr[9] if major > 2 else 0
+        body_len = min(frame_size, size - pos - hdr_len)  # clamp to the tag
+        pos += hdr_len + frame_size
+
+        field = ID3_FIELDS.get(fid)
+        if not field or field in found or not frame_size:
+            continue
+        if major == 3 and fflags & 0xc0 or major == 4 and fflags & 0x0c:
+            continue                       # compressed or encrypted
+        body = fh.read(body_len)
+        if major == 4:
+            if fflags & 0x01:              # data length indicator
+                body = body[4:]
+            if fflags & 0x02:
+                body = body.replace(b"\xff\x00", b"\xff")
+        text = _decode_text(body) if body else ""
+        if text:
+            found[field] = text
+    return found
+
+
+def _parse_id3v1(tail):
+    """Text fields from the 128-byte ID3v1 block at the end of a file."""
+    found = {}
+    for field, start in (("title", 3), ("artist", 33), ("album", 63)):
+        text = tail[start:start + 30].split(b"\0")[0].decode("latin-1").strip()
+        if text:
+            found[field] = text
+    return found
+
+
+def _mp3_duration(buf, audio_start, file_size):
+    """Duration from the first MPEG Layer III frame found in `buf`.
+
+    Uses the Xing/Info or VBRI frame count when present, otherwise assumes
+    constant bitrate across the rest of the file.
+    """
+    for i in range(len(buf) - 3):
+        if buf[i] != 0xff or buf[i + 1] & 0xe0 != 0xe0:
+            continue
+        version, layer = buf[i + 1] >> 3 & 3, buf[i + 1] >> 1 & 3
+        br_idx, sr_idx = buf[i + 2] >> 4, buf[i + 2] >> 2 & 3
+        if version == 1 or layer != 1 or br_idx in (0, 15) or sr_idx == 3:
+            continue
+        bitrate = _BITRATES[3 if version == 3 else 2][br_idx] * 1000
+        sample_rate = _SAMPLE_RATES[version][sr_idx]
+        spf = 1152 if version == 3 else 576
+        mono = buf[i + 3] >> 6 == 3
+        side = (17 if mono else 32) if version == 3 else (9 if mono else 17)
+
+        frames = 0
+        xing = i + 4 + side
+        if (buf[xing:xing + 4] in (b"Xing", b"Info")
+                and int.from_bytes(buf[xing + 4:xing + 8], "big") & 1):
+            frames = int.from_bytes(buf[xing + 8:xing + 12], "big")
+        elif buf[i + 36:i + 40] == b"VBRI":
+            frames = int.from_bytes(buf[i + 50:i + 54], "big")
+        if frames:
+            return frames * spf / sample_rate
+        return (file_size - audio_start - i) * 8 / bitrate
+    return 0
+
+
+def _default_meta(path):
+    return {"title": Path(path).stem, "artist": "Unknown", "album": "Unknown", "duration": 0}
+
+
+def _read_mp3_meta(path):
+    """Like get_mp3_meta(), but I/O errors propagate instead of falling back."""
+    meta = _default_meta(path)
+    try:
+        with open(path, "rb", buffering=4096) as fh:
+            file_size = os.fstat(fh.fileno()).st_size
+            head = fh.read(10)
+            audio_start = 0
+            if len(head) == 10 and head[:3] == b"ID3":
+                tag_size = _syncsafe(head[6:10])
+                meta.update(_read_id3v2(fh, head))
+                audio_start = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+                fh.seek(audio_start)
+                buf = fh.read(4096)
+                meta["duration"] = _mp3_duration(buf, audio_start, file_size)
+            else:
+                # Only untagged-by-v2 files pay for the seek to the ID3v1 tail
+                buf = head + fh.read(4086)
+                tail = b""
+                if file_size >= 128:
+                    fh.seek(-128, os.SEEK_END)
+                    tail = fh.read(128)
+                if tail[:3] == b"TAG":
+                    meta.update(_parse_id3v1(tail))
+                    file_size -= 128
+                meta["duration"] = _mp3_duration(buf, audio_start, file_size)
+    except OSError:
+        raise
+    except Exception:
+        pass
+    return meta
+
+
 def get_mp3_meta(path):
-    meta = {"title": Path(path).stem, "artist": "Unknown", "album": "Unknown", "duration": 0}
-    if HAS_MUTAGEN:
-        try:
-            audio = MP3(path)
-            meta["duration"] = audio.info.length
-            tags = ID3(path)
-            if TIT2 in tags: meta["title"]  = str(tags[TIT2])
-            if TPE1 in tags: meta["artist"] = str(tags[TPE1])
-            if TALB in tags: meta["album"]  = str(tags[TALB])
-        except Exception:
-            pass
+    try:
+        return _read_mp3_meta(path)
+    except OSError:
+        return _default_meta(path)
+
+
+def load_meta_cache(path=CACHE_PATH):
+    """Load the {path: {mtime, size, title, artist, album, duration}} cache."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            cache = json.load(fh)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_meta_cache(cache, path=CACHE_PATH):
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(dict(cache), fh)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _cache_hit(entry, st):
+    """True if `entry` matches the stat result and carries usable fields."""
+    if not isinstance(entry, dict):
+        return False
+    if entry.get("mtime") != st.st_mtime or entry.get("size") != st.st_size:
+        return False
+    duration = entry.get("duration")
+    return (all(isinstance(entry.get(k), str) for k in ("title", "artist", "album"))
+            and isinstance(duration, (int, float)) and not isinstance(duration, bool))
+
+
+def get_cached_meta(path, cache):
+    """get_mp3_meta(), skipped when the file's mtime and size are unchanged.
+
+    Reads that fail with an I/O error are not cached, so the file is retried
+    next time instead of staying "Unknown" until it changes.
+    """
+    try:
+        st = os.stat(path)
+        entry = cache.get(path)
+        if _cache_hit(entry, st):
+            return {k: entry[k] for k in ("title", "artist", "album", "duration")}
+        meta = _read_mp3_meta(path)
+    except OSError:
+        return _default_meta(path)
+    cache[path] = meta | {"mtime": st.st_mtime, "size": st.st_size}
     return meta
 
 
+def _finalize_track(t):
+    """Attach the listbox label; done once per track, never on refresh."""
+    t["_label"] = f"  {t['artist']} — {t['title']}" + (
+        f"  [{format_time(t['duration'])}]" if t["duration"] else "")
+    t["_label_lower"] = t["_label"].lower()
+    return t
+
+
+def _meta_with_path(path, cache):
+    meta = get_cached_meta(path, cache)
+    meta["path"] = path
+    return _finalize_track(meta)
+
+
+def read_tracks(paths, cache, alive=lambda: True):
+    """Yield metadata for `paths` in order, reading them concurrently.
+
+    Only a bounded number of reads are queued ahead, and no new ones are
+    started once `alive()` returns False.
+    """
+    todo = iter(paths)
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        pending = deque(ex.submit(_meta_with_path, p, cache)
+                        for _, p in zip(range(2 * SCAN_WORKERS), todo))
+        while pending:
+            meta = pending.popleft().result()
+            if not alive():
+                for fut in pending:
+                    fut.cancel()
+                return
+            yield meta
+            for p in todo:
+                pending.append(ex.submit(_meta_with_path, p, cache))
+                break
+
+
+def placeholder_track(path):
+    """Stand-in shown until the track's tags have been read."""
+    return _finalize_track({"path": path, "title": Path(path).stem,
+                            "artist": "—", "album": "", "duration": 0})
+
+
 def scan_directory(root_path):
     """Recursively find all MP3 files."""
     files = []
-    for dirpath, _, filenames in os.walk(root_path):
-        for f in sorted(filenames):
-            if f.lower().endswith(".mp3"):
-                files.append(os.path.join(dirpath, f))
-    return sorted(files)
+    stack = [root_path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(MP3_SUFFIXES):
+                    files.append(entry.path)
+    files.sort()
+    return files
 
 
 class MP3Player:
@@ -91,26 +385,58 @@ class MP3Player:
         self.root.geometry("820x640")
 
         # State
-        self.playlist     = []   # list of dicts {path, title, artist, duration}
+        self._clear_columns()    # playlist as parallel lists, see TRACK_COLUMNS
         self.current_idx  = -1
         self.is_playing   = False
         self.is_paused    = False
         self.duration     = 0
         self.seek_pos     = 0.0  # seconds elapsed (simulated)
-        self._play_start  = 0    # wall-clock time when play started
+        self._play_start  = 0    # monotonic clock when play started
+        self._last_shown_sec = -1  # elapsed second / percent last drawn,
+        self._last_shown_pct = -1  # so unchanged values skip the Tk update
         self._dragging    = False
         self.volume       = 0.7
         self.shuffle      = False
         self.repeat       = False  # repeat current track
+        self._rng         = random.Random()
+        self._shuffle_queue = []   # upcoming shuffle picks, consumed from the end
+        self._visible     = []   # playlist indices matching the search, in order
+        self._view_top    = 0    # position in _visible of the first listbox row
+        self._autoscan_id = None
+        self._sel_idx     = -1   # playlist index of the selected row, kept while scrolling
+        self._cached_filter = [] # playlist indices matching _cached_ft
+        self._cached_ft   = ""
+        self._search_after_id = None
+        self._poll_after_id = None
+        self._play_gen    = 0    # bumped per load/stop; stale loads check it
+        self._loading     = False  # a worker load for _play_gen is in flight
+        self._scan_gen    = 0    # bumped when the playlist is replaced/cleared
+        self._mixer_lock  = threading.Lock()
+        self._meta_cache  = load_meta_cache()
 
         pygame.mixer.music.set_volume(self.volume)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Album art backgrounds: one canvas image instead of 180 line items
+        self._grad_idle = make_gradient(root, IDLE_GRADIENT)
+        self._grad_play = make_gradient(root, PLAY_GRADIENT)
 
         self._build_ui()
-        self._poll_playback()
+
+    def _on_close(self):
+        save_meta_cache(self._meta_cache)
+        self.root.destroy()
 
     # ── UI Construction ────────────────────────────────────────────────────────
 
     def _build_ui(self):
+        # Theme once, before any ttk widget exists, to avoid a restyle pass
+        style = ttk.Style()
+        style.theme_use("clam")
+        style.configure("Custom.Horizontal.TScale",
+                        background=BG, troughcolor=TRACK_BG,
+                        sliderlength=14, sliderrelief="flat")
+
         # Left sidebar: controls + info
         left = tk.Frame(self.root, bg=BG, width=280)
         left.pack(side=tk.LEFT, fill=tk.Y, padx=0, pady=0)
@@ -177,11 +503,6 @@ class MP3Player:
         self.lbl_total.pack(side=tk.RIGHT)
 
         self.progress_var = tk.DoubleVar(value=0)
-        style = ttk.Style()
-        style.theme_use("clam")
-        style.configure("Custom.Horizontal.TScale",
-                        background=BG, troughcolor=TRACK_BG,
-                        sliderlength=14, sliderrelief="flat")
         self.progress_bar = ttk.Scale(prog_frame, from_=0, to=100,
                                       orient=tk.HORIZONTAL,
                                       variable=self.progress_var,
@@ -276,10 +597,10 @@ class MP3Player:
         list_frame = tk.Frame(parent, bg=BG2)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 12))
 
-        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL,
-                                 bg=BG3, troughcolor=BG2,
-                                 relief="flat", bd=0, width=8)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL,
+                                      bg=BG3, troughcolor=BG2,
+                                      relief="flat", bd=0, width=8)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         self.listbox = tk.Listbox(list_frame,
                                   bg=BG2, fg=TEXT_MID,
@@ -288,11 +609,25 @@ class MP3Player:
                                   activestyle="none",
                                   relief="flat", bd=0,
                                   font=FONT_LIST,
-                                  yscrollcommand=scrollbar.set,
                                   highlightthickness=0,
                                   cursor="hand2")
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.listbox.yview)
+
+        # The listbox only ever holds one screenful of the playlist. Every
+        # binding that would scroll its own view is overridden to move the
+        # window through _scroll_to instead.
+        self._row_height = (tkfont.Font(root=self.root, font=FONT_LIST).metrics("linespace")
+                            + 1 + 2 * int(self.listbox.cget("selectborderwidth")))
+        self.scrollbar.config(command=self._yview)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.listbox.bind(seq, self._on_wheel)
+        for seq in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.listbox.bind(seq, self._on_nav_key)
+        self.listbox.bind("<B1-Leave>", self._on_drag_leave)
+        self.listbox.bind("<B1-Enter>", self._stop_autoscan)
+        self.listbox.bind("<ButtonRelease-1>", self._stop_autoscan)
+        self.listbox.bind("<Configure>", lambda e: self._set_visible(self._visible))
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
 
         self.listbox.bind("<Double-Button-1>", self._on_double_click)
         self.listbox.bind("<Return>", self._on_double_click)
@@ -309,14 +644,7 @@ class MP3Player:
     def _draw_default_art(self):
         c = self.art_canvas
         c.delete("all")
-        # Background gradient approximation
-        for i in range(180):
-            ratio = i / 180
-            r = int(0x22 + (0x0f - 0x22) * ratio)
-            g = int(0x22 + (0x0f - 0x22) * ratio)
-            b = int(0x2c + (0x13 - 0x2c) * ratio)
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            c.create_line(0, i, 220, i, fill=color)
+        c.create_image(0, 0, anchor="nw", image=self._grad_idle)
         # Music note
         c.create_text(110, 90, text="♪", font=("Helvetica", 72),
                       fill=ACCENT, anchor="center")
@@ -326,13 +654,7 @@ class MP3Player:
     def _draw_playing_art(self, title, artist):
         c = self.art_canvas
         c.delete("all")
-        for i in range(180):
-            ratio = i / 180
-            r = int(0x3b + (0x18 - 0x3b) * ratio)
-            g = int(0x0f + (0x0f - 0x0f) * ratio)
-            b = int(0x52 + (0x1f - 0x52) * ratio)
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            c.create_line(0, i, 220, i, fill=color)
+        c.create_image(0, 0, anchor="nw", image=self._grad_play)
         c.create_text(110, 70, text="♫", font=("Helvetica", 56),
                       fill="#e9d5ff", anchor="center")
         c.create_text(110, 130, text=title[:20], font=("Helvetica", 10, "bold"),
@@ -343,24 +665,166 @@ class MP3Player:
     # ── Playlist Helpers ──────────────────────────────────────────────────────
 
     def _refresh_list(self, filter_text=""):
-        self.listbox.delete(0, tk.END)
         ft = filter_text.lower()
-        for i, t in enumerate(self.playlist):
-            label = f"{t['artist']} — {t['title']}"
-            if ft and ft not in label.lower():
-                continue
-            dur = f"  [{format_time(t['duration'])}]" if t['duration'] else ""
-            self.listbox.insert(tk.END, f"  {label}{dur}")
+        self._view_top = 0
+        self._set_visible(self._filter(ft))
+
+        self.lbl_count.config(text=f"{len(self.paths)} tracks")
+        self._select_current()
+
+    def _filter(self, ft):
+        """Playlist indices whose label contains `ft` (already lowercased)."""
+        if self._cached_ft and ft.startswith(self._cached_ft):
+            # Refining the previous search can only narrow its result set
+            candidates = self._cached_filter
+        else:
+            candidates = range(len(self.paths))
+        if ft:
+            labels_lower = self.labels_lower
+            visible = [i for i in candidates if ft in labels_lower[i]]
+        else:
+            visible = list(candidates)
+        self._cached_filter = visible
+        self._cached_ft = ft
+        return visible
+
+    def _set_visible(self, visible):
+        self._visible = visible
+        self._view_top = max(0, min(self._view_top, len(visible) - self._page_rows()))
+        self._fill_window()
+
+    def _fill_window(self):
+        """Load the screenful of labels starting at _view_top into the listbox."""
+        labels = self.labels
+        # One extra row fills a partially visible bottom line
+        window = self._visible[self._view_top:self._view_top + self._page_rows() + 1]
+        self.listbox.delete(0, tk.END)
+        if window:
+            self.listbox.insert(tk.END, *[labels[k] for k in window])
+        self.listbox.yview_moveto(0)
+        self._apply_selection()
+        self._update_scrollbar()
+
+    def _page_rows(self):
+        """Number of rows that fit in the listbox as currently sized."""
+        return max(1, self.listbox.winfo_height() // self._row_height)
+
+    def _update_scrollbar(self):
+        n = len(self._visible)
+        if n:
+            self.scrollbar.set(self._view_top / n,
+                               min(1.0, (self._view_top + self._page_rows()) / n))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self._visible) - self._page_rows()))
+        if top != self._view_top:
+            self._view_top = top
+            self._fill_window()
+
+    def _yview(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._visible)))
+        else:
+            step = self._page_rows() if args[2] == "pages" else 1
+            self._scroll_to(self._view_top + int(args[1]) * step)
 
-        self.lbl_count.config(text=f"{len(self.playlist)} tracks")
+    def _on_wheel(self, event):
+        up = event.num == 4 or event.delta > 0
+        self._scroll_to(self._view_top + (-3 if up else 3))
+        return "break"
 
-        if self.current_idx >= 0:
-            self.listbox.selection_clear(0, tk.END)
-            idx = min(self.current_idx, self.listbox.size() - 1)
-            self.listbox.selection_set(idx)
-            self.listbox.see(idx)
+    def _on_select(self, event):
+        sel = self.listbox.curselection()
+        if sel:
+            self._sel_idx = self._visible[self._view_top + sel[0]]
+
+    def _on_nav_key(self, event):
+        # "break" also stops the root-level Up/Down volume shortcuts, which
+        # used to fire alongside the listbox's own bindings
+        if event.keysym in ("Up", "Down"):
+            self._step_volume(5 if event.keysym == "Up" else -5)
+        n = len(self._visible)
+        if not n:
+            return "break"
+        pos = self._pos_of(self._sel_idx)
+        if pos < 0:
+            pos = self._view_top
+        page = self._page_rows()
+        pos = {"Up": pos - 1, "Down": pos + 1, "Prior": pos - page,
+               "Next": pos + page, "Home": 0, "End": n - 1}[event.keysym]
+        pos = max(0, min(pos, n - 1))
+        if pos < self._view_top:
+            self._scroll_to(pos)
+        elif pos >= self._view_top + page:
+            self._scroll_to(pos - page + 1)
+        self._sel_idx = self._visible[pos]
+        self._apply_selection()
+        self.listbox.activate(pos - self._view_top)
+        return "break"
+
+    def _on_drag_leave(self, event):
+        # Replaces the listbox's own autoscan, which scrolls its internal view
+        self._stop_autoscan()
+        if event.y < 0:
+            self._autoscan(-1)
+        elif event.y >= self.listbox.winfo_height():
+            self._autoscan(1)
+        return "break"
+
+    def _autoscan(self, step):
+        self._scroll_to(self._view_top + step)
+        self._autoscan_id = self.root.after(AUTOSCAN_MS, self._autoscan, step)
+
+    def _stop_autoscan(self, event=None):
+        if self._autoscan_id:
+            self.root.after_cancel(self._autoscan_id)
+            self._autoscan_id = None
+
+    def _pos_of(self, idx):
+        """Position of playlist index `idx` in _visible, or -1 if filtered out."""
+        pos = bisect.bisect_left(self._visible, idx)
+        if pos < len(self._visible) and self._visible[pos] == idx:
+            return pos
+        return -1
+
+    def _apply_selection(self):
+        """Select the row for _sel_idx if it is inside the window."""
+        self.listbox.selection_clear(0, tk.END)
+        pos = self._pos_of(self._sel_idx)
+        if pos >= 0 and 0 <= pos - self._view_top < self.listbox.size():
+            self.listbox.selection_set(pos - self._view_top)
+
+    def _mark_current(self):
+        self._sel_idx = self.current_idx
+        self._apply_selection()
+
+    def _select_current(self):
+        """Highlight the current track, scrolling it into view if needed."""
+        pos = self._pos_of(self.current_idx)
+        page = self._page_rows()
+        if pos >= 0 and not self._view_top <= pos < self._view_top + page:
+            self._scroll_to(pos - page // 2)
+        self._mark_current()
+
+    def _reset_list(self):
+        """Drop all rows; call whenever existing playlist indices change meaning."""
+        self.listbox.delete(0, tk.END)
+        self._visible = []
+        self._view_top = 0
+        self._sel_idx = -1
+        self._cached_filter = []
+        self._cached_ft = ""
 
     def _on_search(self, *args):
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
         self._refresh_list(self.search_var.get())
 
     # ── File I/O ──────────────────────────────────────────────────────────────
@@ -374,9 +838,8 @@ class MP3Player:
 
         def do_scan():
             files = scan_directory(folder)
-            tracks = [get_mp3_meta(f) | {"path": f} for f in files]
-            self.root.after(0, lambda: self._load_tracks(tracks, replace=True,
-                                                          source=folder))
+            self.root.after(0, lambda: self._begin_tracks(files, replace=True,
+                                                           source=folder))
         threading.Thread(target=do_scan, daemon=True).start()
 
     def _add_files(self):
@@ -386,26 +849,120 @@ class MP3Player:
         )
         if not paths:
             return
-        tracks = [get_mp3_meta(p) | {"path": p} for p in paths]
-        self._load_tracks(tracks, replace=False, source=f"{len(paths)} files")
+        self._begin_tracks(list(paths), replace=False, source=f"{len(paths)} files")
+
+    def _begin_tracks(self, paths, replace, source):
+        """Show `paths` by filename right away and read their tags in the background."""
+        base = 0 if replace else len(self.paths)
+        self._load_tracks([placeholder_track(p) for p in paths], replace, source)
+        threading.Thread(target=self._fetch_meta, args=(paths, base, self._scan_gen),
+                         daemon=True).start()
+
+    def _fetch_meta(self, paths, base, gen):
+        # Runs off the UI thread; results are applied in META_BATCH chunks.
+        # Stops reading as soon as the playlist it was started for is gone.
+        alive = lambda: gen == self._scan_gen
+        batch = []
+        for i, meta in enumerate(read_tracks(paths, self._meta_cache, alive), base):
+            batch.append((i, meta))
+            if len(batch) == META_BATCH:
+                self.root.after(0, self._patch_tracks, batch)
+                batch = []
+        if batch and alive():
+            self.root.after(0, self._patch_tracks, batch)
+
+    def _patch_tracks(self, updates):
+        patched = []
+        for i, meta in updates:
+            if i >= len(self.paths) or self.paths[i] != meta["path"]:
+                # Playlist changed meanwhile; the track may sit elsewhere now
+                i = self._path_to_idx.get(meta["path"])
+                if i is None:
+                    continue
+            for attr, key in TRACK_COLUMNS:
+                getattr(self, attr)[i] = meta[key]
+            patched.append(i)
+            pos = self._pos_of(i)
+            row = pos - self._view_top
+            if pos >= 0 and 0 <= row < self.listbox.size():
+                self.listbox.delete(row)
+                self.listbox.insert(row, self.labels[i])
+            if i == self.current_idx:
+                self.duration = self.durations[i]
+                self._show_track_info(i)
+
+        # _cached_ft is the filter _visible was built with; a pending
+        # debounced search will rebuild it anyway
+        if self._cached_ft:
+            self._refilter(patched, self._cached_ft)
+        else:
+            # Replacing rows drops their selection
+            self._apply_selection()
+
+    def _refilter(self, patched, ft):
+        """Re-test only the patched indices against `ft` and merge into _visible."""
+        visible, labels_lower = self._visible, self.labels_lower
+        top = self._view_top
+        refill = moved = False
+        for i in patched:
+            pos = self._pos_of(i)
+            if (pos >= 0) == (ft in labels_lower[i]):
+                continue
+            moved = True
+            if pos >= 0:
+                del visible[pos]
+                shift = -1
+            else:
+                pos = bisect.bisect_left(visible, i)
+                visible.insert(pos, i)
+                shift = 1
+            if pos < top:
+                top += shift    # rows above the window; its contents stay put
+            elif pos <= top + self._page_rows():
+                refill = True
+        self._cached_filter = visible
+        self._view_top = top
+        if refill:
+            self._set_visible(visible)
+        else:
+            if moved:
+                self._update_scrollbar()
+            self._apply_selection()
+
+    def _clear_columns(self):
+        for attr, _ in TRACK_COLUMNS:
+            setattr(self, attr, [])
+        self._path_to_idx = {}   # path -> first playlist index holding it
 
     def _load_tracks(self, tracks, replace, source):
+        self._shuffle_queue = []  # reshuffle with the new tracks included
         if replace:
-            self.playlist = tracks
+            self._scan_gen += 1
+            self._clear_columns()
+            self._reset_list()
         else:
-            self.playlist.extend(tracks)
-        self._refresh_list()
+            # New indices may match a search that was refined without them
+            self._cached_ft = ""
+        base = len(self.paths)
+        for attr, key in TRACK_COLUMNS:
+            getattr(self, attr).extend(t[key] for t in tracks)
+        for i, t in enumerate(tracks, base):
+            self._path_to_idx.setdefault(t["path"], i)
+        self._refresh_list(self.search_var.get())
         n = len(tracks) if replace else len(tracks)
         self.status_var.set(f"Loaded {n} track(s) from {source}")
-        if replace and self.playlist:
+        if replace and self.paths:
             self.current_idx = 0
             self._load_track(0)
 
     def _clear_playlist(self):
         self._stop()
-        self.playlist = []
+        self._scan_gen += 1
+        self._clear_columns()
+        self._shuffle_queue = []
         self.current_idx = -1
-        self._refresh_list()
+        self._reset_list()
+        self._refresh_list(self.search_var.get())
         self.lbl_title.config(text="No track loaded")
         self.lbl_artist.config(text="—")
         self.lbl_album.config(text="")
@@ -418,84 +975,129 @@ class MP3Player:
     # ── Playback ──────────────────────────────────────────────────────────────
 
     def _load_track(self, idx):
-        if idx < 0 or idx >= len(self.playlist):
+        if idx < 0 or idx >= len(self.paths):
             return
         self.current_idx = idx
-        track = self.playlist[idx]
-        self.duration = track["duration"]
+        self.duration = self.durations[idx]
         self.seek_pos = 0.0
 
-        self.lbl_title.config(text=track["title"])
-        self.lbl_artist.config(text=track["artist"])
-        self.lbl_album.config(text=track["album"])
-        self.lbl_total.config(text=format_time(self.duration))
+        self._show_track_info(idx)
         self.lbl_elapsed.config(text="0:00")
         self.progress_var.set(0)
-        self._draw_playing_art(track["title"], track["artist"])
-
-        self.listbox.selection_clear(0, tk.END)
-        self.listbox.selection_set(idx)
-        self.listbox.see(idx)
+        self._last_shown_sec = self._last_shown_pct = 0
+        self._select_current()
 
-        try:
-            pygame.mixer.music.load(track["path"])
-            pygame.mixer.music.play()
-            self._play_start = time.time()
-            self.is_playing = True
-            self.is_paused = False
-            self.btn_play.config(text="⏸")
-            self.status_var.set(f"♪ Playing: {track['artist']} — {track['title']}")
-        except Exception as e:
-            messagebox.showerror("Playback Error", str(e))
+        # Playing again once the worker reports back via _on_play_started
+        self.is_playing = False
+        self.is_paused = False
+        self._loading = True
+        self._play_gen += 1
+        self._begin_play(self.paths[idx], self._play_gen)
+
+    def _begin_play(self, path, gen):
+        # music.load() reads from disk and can stall on slow or network
+        # storage, so it runs on a worker; the lock keeps loads in order.
+        def work():
+            with self._mixer_lock:
+                if gen != self._play_gen:
+                    return  # superseded by a newer track or a stop
+                try:
+                    pygame.mixer.music.load(path)
+                    if gen != self._play_gen:
+                        return
+                    pygame.mixer.music.play()
+                    if gen != self._play_gen:
+                        # Stopped or superseded between the check and play()
+                        pygame.mixer.music.stop()
+                        return
+                except Exception as e:
+                    self.root.after(0, self._on_play_failed, gen, e)
+                    return
+            self.root.after(0, self._on_play_started, gen)
+        threading.Thread(target=work, daemon=True).start()
+
+    def _on_play_started(self, gen):
+        if gen != self._play_gen:
+            return
+        self._loading = False
+        idx = self.current_idx
+        self._play_start = time.monotonic()
+        self.is_playing = True
+        self.is_paused = False
+        self._schedule_poll()
+        self.btn_play.config(text="⏸")
+        self.status_var.set(f"♪ Playing: {self.artists[idx]} — {self.titles[idx]}")
+
+    def _on_play_failed(self, gen, error):
+        if gen == self._play_gen:
+            self._loading = False
+            messagebox.showerror("Playback Error", str(error))
+
+    def _show_track_info(self, idx):
+        self.lbl_title.config(text=self.titles[idx])
+        self.lbl_artist.config(text=self.artists[idx])
+        self.lbl_album.config(text=self.albums[idx])
+        self.lbl_total.config(text=format_time(self.durations[idx]))
+        self._draw_playing_art(self.titles[idx], self.artists[idx])
 
     def _play_pause(self):
-        if not self.playlist:
+        if not self.paths:
             return
         if self.current_idx < 0:
             self._load_track(0)
             return
+        if self._loading:
+            return  # the pending load decides the play state
 
         if self.is_playing and not self.is_paused:
             pygame.mixer.music.pause()
             self.is_paused = True
-            self._pause_pos = time.time() - self._play_start
+            self._pause_pos = time.monotonic() - self._play_start
             self.btn_play.config(text="▶")
             self.status_var.set("Paused")
         elif self.is_paused:
             pygame.mixer.music.unpause()
-            self._play_start = time.time() - self._pause_pos
+            self._play_start = time.monotonic() - self._pause_pos
             self.is_paused = False
+            self._schedule_poll()
             self.btn_play.config(text="⏸")
-            t = self.playlist[self.current_idx]
-            self.status_var.set(f"♪ Playing: {t['artist']} — {t['title']}")
+            i = self.current_idx
+            self.status_var.set(f"♪ Playing: {self.artists[i]} — {self.titles[i]}")
         else:
             self._load_track(self.current_idx)
 
     def _stop(self):
+        self._play_gen += 1
+        self._loading = False
         pygame.mixer.music.stop()
         self.is_playing = False
         self.is_paused = False
         self.btn_play.config(text="▶")
 
     def _next_track(self):
-        if not self.playlist:
+        if not self.paths:
             return
         if self.shuffle:
-            import random
-            idx = random.randint(0, len(self.playlist) - 1)
+            # Every track plays once before any repeats
+            if not self._shuffle_queue:
+                q = self._shuffle_queue = list(range(len(self.paths)))
+                self._rng.shuffle(q)
+                if len(q) > 1 and q[-1] == self.current_idx:
+                    q[0], q[-1] = q[-1], q[0]
+            idx = self._shuffle_queue.pop()
         else:
-            idx = (self.current_idx + 1) % len(self.playlist)
+            idx = (self.current_idx + 1) % len(self.paths)
         self._load_track(idx)
 
     def _prev_track(self):
-        if not self.playlist:
+        if not self.paths:
             return
-        elapsed = time.time() - self._play_start if self.is_playing else 0
+        elapsed = time.monotonic() - self._play_start if self.is_playing else 0
         if elapsed > 3:
             # restart current track
             self._load_track(self.current_idx)
         else:
-            idx = (self.current_idx - 1) % len(self.playlist)
+            idx = (self.current_idx - 1) % len(self.paths)
             self._load_track(idx)
 
     def _toggle_shuffle(self):
@@ -507,12 +1109,14 @@ class MP3Player:
         self.btn_repeat.config(fg=ACCENT if self.repeat else TEXT)
 
     def _on_double_click(self, event):
-        sel = self.listbox.curselection()
-        if sel:
-            self._load_track(sel[0])
+        if self._pos_of(self._sel_idx) >= 0:
+            self._load_track(self._sel_idx)
 
     # ── Volume / Seek ─────────────────────────────────────────────────────────
 
+    def _step_volume(self, delta):
+        self.vol_var.set(max(0, min(self.vol_var.get() + delta, 100)))
+
     def _on_volume(self, val):
         self.volume = float(val) / 100
         pygame.mixer.music.set_volume(self.volume)
@@ -521,38 +1125,90 @@ class MP3Player:
         if self._dragging and self.duration > 0:
             pos = float(val) / 100 * self.duration
             self.lbl_elapsed.config(text=format_time(pos))
+            self._last_shown_sec = -1
 
     def _on_seek_release(self, event):
         self._dragging = False
+        # Seeking needs the current track loaded; while a worker is still
+        # loading it, the mixer holds the previous track (or nothing).
+        if self._loading or self.current_idx < 0:
+            self._snap_progress()
+            return
         if self.duration > 0:
             pct = self.progress_var.get() / 100
+            self._last_shown_pct = -1
             pos = pct * self.duration
-            pygame.mixer.music.play(start=pos)
-            self._play_start = time.time() - pos
+            if not self._mixer_lock.acquire(blocking=False):
+                self._snap_progress()
+                return
+            try:
+                pygame.mixer.music.play(start=pos)
+            except pygame.error:
+                self._snap_progress()
+                return
+            finally:
+                self._mixer_lock.release()
+            self._play_start = time.monotonic() - pos
             self.is_playing = True
             self.is_paused = False
+            self._schedule_poll()
             self.btn_play.config(text="⏸")
 
+    def _snap_progress(self):
+        """Put the slider and elapsed label back after a seek was refused."""
+        if self.is_paused:
+            pos = self._pause_pos
+        elif self.is_playing:
+            pos = time.monotonic() - self._play_start
+        else:
+            pos = 0
+        self._last_shown_sec = int(pos)
+        self._last_shown_pct = (
+            int(min(pos / self.duration * 100, 100)) if self.duration > 0 else 0)
+        self.lbl_elapsed.config(text=format_time(pos))
+        self.progress_var.set(self._last_shown_pct)
+
     # ── Polling ───────────────────────────────────────────────────────────────
 
+    def _schedule_poll(self, delay=0):
+        if self._poll_after_id:
+            self.root.after_cancel(self._poll_after_id)
+        self._poll_after_id = self.root.after(delay, self._poll_playback)
+
     def _poll_playback(self):
+        self._poll_after_id = None
         if self.is_playing and not self.is_paused and not self._dragging:
-            elapsed = time.time() - self._play_start
-            self.lbl_elapsed.config(text=format_time(elapsed))
+            elapsed = time.monotonic() - self._play_start
+            sec = int(elapsed)
+            if sec != self._last_shown_sec:
+                self._last_shown_sec = sec
+                self.lbl_elapsed.config(text=format_time(sec))
 
             if self.duration > 0:
-                pct = min(elapsed / self.duration * 100, 100)
-                self.progress_var.set(pct)
-
-            # Check if track ended
-            if not pygame.mixer.music.get_busy() and elapsed >= self.duration - 0.5 and self.duration > 0:
+                pct = int(min(elapsed / self.duration * 100, 100))
+                if pct != self._last_shown_pct:
+                    self._last_shown_pct = pct
+                    self.progress_var.set(pct)
+
+            # Check if track ended. stop() also posts TRACK_END, so the event
+            # only counts once the mixer has really gone quiet.
+            if HAS_ENDEVENT:
+                ended = any(ev.type == TRACK_END for ev in pygame.event.get())
+            else:
+                ended = True
+            if ended and not pygame.mixer.music.get_busy():
                 self.is_playing = False
                 if self.repeat:
                     self._load_track(self.current_idx)
                 else:
                     self._next_track()
+                return
 
-        self.root.after(500, self._poll_playback)
+        # Only keep polling while playing; pause/stop leave the event loop idle
+        if self.is_playing and not self.is_paused:
+            remaining = self.duration - (time.monotonic() - self._play_start)
+            self._schedule_poll(POLL_TAIL_MS if 0 < self.duration and remaining < 2
+                                else POLL_MS)
 
 
 # ── Entry Point ───────────────────────────────────────────────────────────────
@@ -573,8 +1229,8 @@ def main():
     root.bind("<space>",      lambda e: app._play_pause())
     root.bind("<Right>",      lambda e: app._next_track())
     root.bind("<Left>",       lambda e: app._prev_track())
-    root.bind("<Up>",         lambda e: app.vol_var.set(min(app.vol_var.get() + 5, 100)))
-    root.bind("<Down>",       lambda e: app.vol_var.set(max(app.vol_var.get() - 5, 0)))
+    root.bind("<Up>",         lambda e: app._step_volume(5))
+    root.bind("<Down>",       lambda e: app._step_volume(-5))
 
     root.mainloop()
 